@@ -1,6 +1,10 @@
-import gradio as gr
-
 def greet(name):
     return "Hello " + name.capitalize() + "!"
 
-gr.Interface(fn=greet, inputs="text", outputs="text").launch(server_name='0.0.0.0', server_port=8080)
\ No newline at end of file
+def launch():
+    import gradio as gr
+
+    gr.Interface(fn=greet, inputs="text", outputs="text").launch(server_name='0.0.0.0', server_port=8080)
+
+if __name__ == "__main__":
+    launch()